@@ -4,7 +4,14 @@ import warnings
 # Suppress InsecureRequestWarning for HTTPS requests to localhost
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-from .kamiwaza_router import KamiwazaRouter
 from .version import __version__
 
 __all__ = ["KamiwazaRouter", "__version__"]
+
+
+def __getattr__(name):
+    # Import the router (and with it litellm's provider registry) only on first use
+    if name == "KamiwazaRouter":
+        from .kamiwaza_router import KamiwazaRouter
+        return KamiwazaRouter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,15 @@
 from asyncio.log import logger
 import logging
 import litellm
-from litellm import Router, completion
+from litellm import Router
 from kamiwaza_client import KamiwazaClient
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 import os
+import re
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import urllib3
 
 # Disable insecure request warnings
@@ -33,12 +37,77 @@ except ImportError as e:
         return None # Or raise ImportError("Static models config not found")
 
 
+# Share one KamiwazaClient (and its pooled requests.Session) per base URL so
+# repeated router constructions don't rebuild HTTP/auth state every time.
+# Keyed by (url, verify_ssl) so routers with different SSL settings never share a session.
+_CLIENT_CACHE: Dict[Tuple[str, bool], KamiwazaClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Upper bound on how long multi-instance discovery waits for all instances to answer
+_DISCOVERY_TIMEOUT_SECONDS = 10.0
+
+# (connect, read) timeout for Kamiwaza API calls. KamiwazaClient sets none of its own,
+# so without it a hung instance would pin a discovery thread forever; connect + read
+# stays within _DISCOVERY_TIMEOUT_SECONDS so the thread ends around the deadline.
+_KAMIWAZA_REQUEST_TIMEOUT = (3.0, 7.0)
+
+# How many cache TTLs an unreachable instance's last good models keep being served
+_LAST_GOOD_MAX_AGE_TTLS = 3
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests sent without one."""
+
+    def __init__(self, *args, timeout: Tuple[float, float] = _KAMIWAZA_REQUEST_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+
+def _get_or_create_client(url: str, verify_ssl: bool = True) -> KamiwazaClient:
+    """Returns the cached KamiwazaClient for url and verify_ssl, creating it on first use."""
+    url = url.strip()
+    key = (url, verify_ssl)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = KamiwazaClient(url)
+            adapter = _TimeoutHTTPAdapter()
+            client.session.mount("http://", adapter)
+            client.session.mount("https://", adapter)
+            if not verify_ssl:
+                logger.warning(f"Disabling SSL verification for Kamiwaza client: {client.base_url}")
+                client.session.verify = False
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def _deployment_fingerprint(deployments: List[Any]) -> Tuple[Any, ...]:
+    """Collects the deployment fields that feed into the generated model entries.
+
+    The tuple itself is compared, not its hash, so a collision can't serve stale entries.
+    """
+    return tuple(
+        (
+            getattr(d, 'id', None),
+            getattr(d, 'name', None),
+            getattr(d, 'm_name', None),
+            getattr(d, 'status', None),
+            getattr(d, 'lb_port', None),
+            tuple((getattr(i, 'host_name', None), getattr(i, 'status', None)) for i in getattr(d, 'instances', []) or []),
+        )
+        for d in deployments
+    )
+
+
 class KamiwazaRouter(Router):
     def __init__(
         self,
         model_list: Optional[List[Dict[str, Any]]] = None,
         kamiwaza_api_url: Optional[str] = None,
-        kamiwaza_uri_list: Optional[str] = None,
+        kamiwaza_uri_list: Optional[Union[str, List[str], Tuple[str, ...]]] = None,
         cache_ttl_seconds: int = 300,
         model_pattern: Optional[str] = None,
         fallbacks: List = [], # this is also used by super() and we need it for init
@@ -50,7 +119,7 @@ class KamiwazaRouter(Router):
         Args:
             model_list: Optional starting model list (will be merged with Kamiwaza models)
             kamiwaza_api_url: Optional Kamiwaza API URL
-            kamiwaza_uri_list: Optional comma-separated list of Kamiwaza URIs
+            kamiwaza_uri_list: Optional Kamiwaza URIs, as a list/tuple or a comma-separated string
             cache_ttl_seconds: TTL for model cache in seconds
             **kwargs: All other parameters are passed to the Router parent class
         """
@@ -63,8 +132,18 @@ class KamiwazaRouter(Router):
 
         self._cached_model_list: Optional[List[Dict[str, Any]]] = None
         self._cache_timestamp: float = 0.0
+        # model_name -> model index over _cached_model_list, rebuilt whenever the cache is refreshed
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        # Serializes refreshes so concurrent callers with an expired cache trigger a single fetch
+        self._cache_lock = threading.RLock()
         self.cache_ttl_seconds: int = cache_ttl_seconds
+        # Per-instance (fingerprint, monotonic timestamp, models) so unchanged deployments skip the rebuild
+        self._deployment_cache: Dict[str, Tuple[Tuple[Any, ...], float, List[Dict[str, Any]]]] = {}
         self.model_pattern: Optional[str] = model_pattern
+        # Compile once; pattern matching is a case-insensitive substring match
+        self._pattern_re: Optional[re.Pattern] = (
+            re.compile(re.escape(model_pattern), re.IGNORECASE) if model_pattern else None
+        )
         
         # Initialize Kamiwaza clients
         if not kamiwaza_api_url:
@@ -78,7 +157,8 @@ class KamiwazaRouter(Router):
         self.kamiwaza_clients: List[KamiwazaClient] = []
         self.kamiwaza_client: Optional[KamiwazaClient] = None
 
-        # Configure Kamiwaza clients
+        # Configure Kamiwaza clients; SSL verification is applied once, when a shared client is created
+        verify_ssl = os.getenv("KAMIWAZA_VERIFY_SSL", "False").lower() == "true" # Check env var safely
         if not self.has_kamiwaza_source:
             # Log a warning if no Kamiwaza source is defined, but allow proceeding
             # if static models might be available.
@@ -87,19 +167,15 @@ class KamiwazaRouter(Router):
                 "Router will rely solely on static models if configured."
             )
         elif kamiwaza_uri_list:
-            # Split URI list at commas and create a client for each
-            uris = kamiwaza_uri_list.split(",")
-            self.kamiwaza_clients = [KamiwazaClient(uri.strip()) for uri in uris if uri.strip()]
-            for client in self.kamiwaza_clients:
-                if not os.getenv("KAMIWAZA_VERIFY_SSL", "False").lower() == "true": # Check env var safely
-                    logger.warning(f"Disabling SSL verification for Kamiwaza client: {client.base_url}")
-                    client.session.verify = False
+            # Accept URIs as given, or split a comma-separated string, and create a client for each
+            if isinstance(kamiwaza_uri_list, (list, tuple)):
+                uris = list(kamiwaza_uri_list)
+            else:
+                uris = kamiwaza_uri_list.split(",")
+            self.kamiwaza_clients = [_get_or_create_client(uri, verify_ssl) for uri in uris if uri.strip()]
         elif kamiwaza_api_url:
             # Use the API URL if provided
-            self.kamiwaza_client = KamiwazaClient(kamiwaza_api_url)
-            if not os.getenv("KAMIWAZA_VERIFY_SSL", "False").lower() == "true": # Check env var safely
-                logger.warning(f"Disabling SSL verification for Kamiwaza client: {self.kamiwaza_client.base_url}")
-                self.kamiwaza_client.session.verify = False
+            self.kamiwaza_client = _get_or_create_client(kamiwaza_api_url, verify_ssl)
 
         # Get initial model list from Kamiwaza and static configs
         # When creating a new router with pattern, we should not use cache to ensure proper filtering
@@ -126,33 +202,42 @@ class KamiwazaRouter(Router):
                 if model.get('model_name') not in existing_model_names:
                     final_model_list.append(model)
                     
-        if model_pattern:
-            # Properly filter models by pattern, ensuring it's a substring match with proper case handling
-            filtered_models = []
-            for m in final_model_list:
-                model_name = m.get('model_name', '')
-                # Ensure exact pattern match (case insensitive)
-                if model_pattern.lower() in model_name.lower():
-                    self.logger.debug(f"Model {model_name} matches pattern {model_pattern}")
-                    filtered_models.append(m)
-                else:
-                    self.logger.debug(f"Model {model_name} does NOT match pattern {model_pattern}")
-            final_model_list = filtered_models
+        if self._pattern_re is not None:
+            # Filter the merged list (including any caller-provided models) in a single pass
+            final_model_list = self._filter_by_pattern(final_model_list)
             self.logger.info(f"Filtered to {len(final_model_list)} models matching pattern '{model_pattern}'")
             if len(final_model_list) == 0:
                 self.logger.warning(f"No models match the pattern '{model_pattern}'!")
 
         # Store in our cache to avoid reloading
-        self._cached_model_list = final_model_list.copy()
-        self._cache_timestamp = time.time()
+        self._set_model_cache(final_model_list.copy(), time.monotonic())
+
+        # Router.__init__ goes through set_model_list(), which resets the caches
+        deployment_cache = dict(self._deployment_cache)
 
         # Call the parent class's __init__ with the merged model list and all other params
         super().__init__(model_list=final_model_list, **kwargs)
+
+        # Restore the caches so the first get_model_list() after construction doesn't query
+        # Kamiwaza again, and so later refreshes can reuse or fall back to per-instance models
+        self._set_model_cache(final_model_list.copy(), time.monotonic())
+        self._deployment_cache = deployment_cache
         logger.info(f"KamiwazaRouter initialized with {len(final_model_list)} models.")
 
 
     def get_models_from_kamiwaza(self, kamiwaza_client: KamiwazaClient) -> List[Dict[str, Any]]:
-        """Fetches and formats deployed models from a specific Kamiwaza instance. Returns empty list on failure."""
+        """
+        Fetches and formats deployed models from a specific Kamiwaza instance.
+        On failure returns the instance's last successfully fetched models, or an empty list.
+        """
+        return self._fetch_instance_models(kamiwaza_client)[0]
+
+
+    def _fetch_instance_models(self, kamiwaza_client: KamiwazaClient) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Returns (models, fetched) for one Kamiwaza instance. fetched is False when the
+        instance could not be queried; models then holds its last good entries, if any.
+        """
         try:
             logger.debug(f"Attempting to fetch models from Kamiwaza: {kamiwaza_client.base_url}")
             # Set a timeout of 1 second for deployments API call
@@ -160,6 +245,14 @@ class KamiwazaRouter(Router):
             deployments = kamiwaza_client.serving.list_deployments()
             logger.debug(f"Received {len(deployments)} deployments from {kamiwaza_client.base_url}")
 
+            # Reuse the previously built entries if the deployments haven't changed within the TTL
+            fingerprint = _deployment_fingerprint(deployments)
+            now = time.monotonic()
+            cached = self._deployment_cache.get(kamiwaza_client.base_url)
+            if cached and cached[0] == fingerprint and (now - cached[1]) < self.cache_ttl_seconds:
+                logger.debug(f"Deployments unchanged for {kamiwaza_client.base_url}, reusing {len(cached[2])} cached models")
+                return list(cached[2]), True
+
             # Filter for deployments that are deployed and have at least one deployed instance
             up_deployments = [
                 d for d in deployments
@@ -168,68 +261,127 @@ class KamiwazaRouter(Router):
             ]
             logger.debug(f"Found {len(up_deployments)} 'DEPLOYED' deployments with deployed instances.")
 
-            models_list = []
-            for d in up_deployments:
-                # Safely get deployment name and model name
-                deployment_name = getattr(d, 'name', 'model')
-                model_name = getattr(d, 'm_name', deployment_name)
-                
-                # Use a reasonable default if m_name is empty or "Unknown"
-                if not model_name or model_name == "Unknown":
-                    model_name = f"model-{getattr(d, 'id', 'unknown')}"
-
-                # Get the first DEPLOYED instance
-                deployed_instances = [i for i in getattr(d, 'instances', []) if hasattr(i, 'status') and i.status == 'DEPLOYED']
-                instance = deployed_instances[0] if deployed_instances else None
-
-                # Determine the host to use - default to localhost for empty host_name
-                host = "localhost"  # Default to localhost
-                if instance and hasattr(instance, 'host_name') and instance.host_name:
-                    host = instance.host_name
-                else:
-                    # Fallback: Extract host from client.base_url if instance host_name is missing
-                    base_url = kamiwaza_client.base_url
-                    try:
-                        if '://' in base_url:
-                            host_part = base_url.split('://')[1].split('/')[0]
-                        else:
-                            host_part = base_url.split('/')[0]
-                        temp_host = host_part.split(':')[0] if ':' in host_part else host_part
-                        if temp_host and temp_host != "":
-                            host = temp_host
-                        # Log that we're using a derived host
-                        logger.debug(f"Using host '{host}' derived from base_url for deployment '{model_name}'")
-                    except IndexError:
-                         logger.warning(f"Could not parse host from base_url: {base_url} for deployment '{model_name}'. Using default host: {host}")
-
-                lb_port = getattr(d, 'lb_port', None)
-                
-                if not lb_port:
-                    logger.warning(f"Model {model_name} missing lb_port, skipping")
-                    continue
-                
-                model_config = {
-                    "model_name": model_name, # Use actual model name (m_name) as the identifier
-                    "litellm_params": {
-                        "model": "openai/model", # Target the specific deployment endpoint via d.name
-                        "api_key": "no_key", # API key is often handled by the proxy/gateway
-                        "api_base": f"http://{host}:{lb_port}/v1" # Assuming HTTP endpoint for the load balancer
-                    },
-                    "model_info": {
-                        "id": model_name,
-                        "deployment_id": getattr(d, 'id', None),
-                        "status": getattr(d, 'status', None)
-                    }
-                }
-                models_list.append(model_config)
-                logger.debug(f"Successfully processed deployment '{deployment_name}' (model: {model_name}) from {kamiwaza_client.base_url}")
+            # Deployments are already in memory here, so building entries is pure CPU work
+            models_list = [m for m in (self._build_model_entry(kamiwaza_client, d) for d in up_deployments) if m is not None]
 
             logger.info(f"Successfully fetched and processed {len(models_list)} models from {kamiwaza_client.base_url}")
-            return models_list
+            self._deployment_cache[kamiwaza_client.base_url] = (fingerprint, now, models_list)
+            return list(models_list), True
         except Exception as e:
-            # Log as warning instead of error, return empty list
+            # Log as warning instead of error and fall back to this instance's last good models
             logger.warning(f"Could not fetch or process models from Kamiwaza {kamiwaza_client.base_url}: {e}", exc_info=True)  # Include full traceback for debugging
-            return []  # Return empty list to allow other sources to potentially provide models
+            return self._last_good_models(kamiwaza_client), False
+
+
+    def _last_good_models(self, kamiwaza_client: KamiwazaClient) -> List[Dict[str, Any]]:
+        """
+        Returns the models from the instance's last successful fetch, or an empty list.
+        Models older than _LAST_GOOD_MAX_AGE_TTLS cache TTLs are dropped instead, so an
+        instance that stays down stops being routed to.
+        """
+        base_url = kamiwaza_client.base_url
+        cached = self._deployment_cache.get(base_url)
+        if not cached:
+            return []
+        age = time.monotonic() - cached[1]
+        if age >= self.cache_ttl_seconds * _LAST_GOOD_MAX_AGE_TTLS:
+            logger.warning(f"Dropping {len(cached[2])} models for {base_url}; last successful fetch was {age:.0f}s ago")
+            self._deployment_cache.pop(base_url, None)
+            return []
+        logger.warning(f"Serving {len(cached[2])} stale models for {base_url} fetched {age:.0f}s ago")
+        return list(cached[2])
+
+
+    def _fetch_models_from_clients(self, clients: List[KamiwazaClient]) -> List[Tuple[List[Dict[str, Any]], bool]]:
+        """
+        Queries several Kamiwaza instances concurrently so discovery takes as long as
+        the slowest instance rather than the sum of all of them.
+
+        Returns one (models, fetched) pair per client, in the order of clients, so duplicate
+        handling downstream is unchanged. An instance that errors or misses the discovery
+        deadline is reported as not fetched and keeps its last good models.
+        """
+        if len(clients) == 1:
+            return [self._fetch_instance_models(clients[0])]
+
+        executor = ThreadPoolExecutor(max_workers=min(32, len(clients)))
+        try:
+            futures = [executor.submit(self._fetch_instance_models, client) for client in clients]
+            deadline = time.monotonic() + _DISCOVERY_TIMEOUT_SECONDS
+            results: List[Tuple[List[Dict[str, Any]], bool]] = []
+            for client, future in zip(clients, futures):
+                try:
+                    results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+                except Exception as e:
+                    logger.warning(f"Skipping Kamiwaza instance {client.base_url} during discovery: {e!r}")
+                    results.append((self._last_good_models(client), False))
+            return results
+        finally:
+            # Don't block on an instance that missed the deadline; its request times out
+            # shortly after (_KAMIWAZA_REQUEST_TIMEOUT), which ends the thread
+            executor.shutdown(wait=False)
+
+
+    def _build_model_entry(self, kamiwaza_client: KamiwazaClient, d: Any) -> Optional[Dict[str, Any]]:
+        """Builds the Router model entry for one deployed deployment, or None if it can't be routed."""
+        # Safely get deployment name and model name
+        deployment_name = getattr(d, 'name', 'model')
+        model_name = getattr(d, 'm_name', deployment_name)
+
+        # Use a reasonable default if m_name is empty or "Unknown"
+        if not model_name or model_name == "Unknown":
+            model_name = f"model-{getattr(d, 'id', 'unknown')}"
+
+        # Get the first DEPLOYED instance without materialising the full list
+        instance = next((i for i in getattr(d, 'instances', []) if getattr(i, 'status', None) == 'DEPLOYED'), None)
+
+        # Determine the host to use - default to localhost for empty host_name
+        host = "localhost"  # Default to localhost
+        if instance and hasattr(instance, 'host_name') and instance.host_name:
+            host = instance.host_name
+        else:
+            # Fallback: Extract host from client.base_url if instance host_name is missing
+            base_url = kamiwaza_client.base_url
+            try:
+                if '://' in base_url:
+                    host_part = base_url.split('://')[1].split('/')[0]
+                else:
+                    host_part = base_url.split('/')[0]
+                temp_host = host_part.split(':')[0] if ':' in host_part else host_part
+                if temp_host and temp_host != "":
+                    host = temp_host
+                # Log that we're using a derived host
+                logger.debug(f"Using host '{host}' derived from base_url for deployment '{model_name}'")
+            except IndexError:
+                 logger.warning(f"Could not parse host from base_url: {base_url} for deployment '{model_name}'. Using default host: {host}")
+
+        lb_port = getattr(d, 'lb_port', None)
+
+        if not lb_port:
+            logger.warning(f"Model {model_name} missing lb_port, skipping")
+            return None
+
+        logger.debug(f"Successfully processed deployment '{deployment_name}' (model: {model_name}) from {kamiwaza_client.base_url}")
+        # Build the entry as a single literal rather than filling in keys incrementally
+        return {
+            "model_name": model_name, # Use actual model name (m_name) as the identifier
+            "litellm_params": {
+                "model": "openai/model", # Target the specific deployment endpoint via d.name
+                "api_key": "no_key", # API key is often handled by the proxy/gateway
+                "api_base": f"http://{host}:{lb_port}/v1" # Assuming HTTP endpoint for the load balancer
+            },
+            "model_info": {
+                "id": model_name,
+                "deployment_id": getattr(d, 'id', None),
+                "status": getattr(d, 'status', None)
+            }
+        }
+
+
+    def _filter_by_pattern(self, models: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Returns the models whose model_name matches the compiled model_pattern."""
+        search = self._pattern_re.search
+        return [m for m in models if search(m.get('model_name') or '')]
 
 
     def _get_static_models(self) -> List[Dict[str, Any]]:
@@ -273,14 +425,54 @@ class KamiwazaRouter(Router):
         Returns:
             A list of model dictionaries compatible with litellm.Router.
         """
-        current_time = time.time()
-
-        # Check cache validity
-        if use_cache and self._cached_model_list is not None and \
-           (current_time - self._cache_timestamp) < self.cache_ttl_seconds:
+        # Fast path: serve a fresh cache without taking the lock
+        cached = self._fresh_cached_models() if use_cache else None
+        if cached is not None:
             logger.debug("Returning cached model list.")
-            return self._cached_model_list
+            return cached
+
+        with self._cache_lock:
+            # Another caller may have refreshed the cache while we waited for the lock
+            cached = self._fresh_cached_models() if use_cache else None
+            if cached is not None:
+                logger.debug("Returning cached model list.")
+                return cached
+            return self._refresh_model_list()
 
+
+    def get_model_by_name(self, model_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached model entry named model_name, or None if there is none.
+        Lookups are served from the name index; Kamiwaza is only queried once the cache has expired.
+        """
+        if self._fresh_cached_models() is None:
+            self.get_kamiwaza_model_list()
+        return self._by_name.get(model_name)
+
+
+    def _set_model_cache(self, models: List[Dict[str, Any]], timestamp: float) -> None:
+        """Stores models as the cached model list and rebuilds the name index."""
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for m in models:
+            # Several deployments may share a name; like the model list, the first one wins
+            by_name.setdefault(m.get('model_name'), m)
+        self._by_name = by_name
+        self._cached_model_list = models
+        self._cache_timestamp = timestamp
+
+
+    def _fresh_cached_models(self) -> Optional[List[Dict[str, Any]]]:
+        """Returns the cached model list if it is younger than cache_ttl_seconds, else None."""
+        # Read the list once; set_model_list() may clear it concurrently
+        cached = self._cached_model_list
+        if cached is not None and (time.monotonic() - self._cache_timestamp) < self.cache_ttl_seconds:
+            return cached
+        return None
+
+
+    def _refresh_model_list(self) -> List[Dict[str, Any]]:
+        """Fetches models from all sources and updates the cache. Callers must hold _cache_lock."""
+        current_time = time.monotonic()
         logger.info(f"Cache expired or not used. Fetching fresh model list (TTL: {self.cache_ttl_seconds}s).")
         new_models: List[Dict[str, Any]] = []
         had_error = False
@@ -289,12 +481,15 @@ class KamiwazaRouter(Router):
         if self.has_kamiwaza_source:
             try:
                 if self.kamiwaza_client:
-                    kamiwaza_models = self.get_models_from_kamiwaza(self.kamiwaza_client)
-                    new_models.extend(kamiwaza_models)
-                elif self.kamiwaza_clients:
-                    for client in self.kamiwaza_clients:
-                        client_models = self.get_models_from_kamiwaza(client)
-                        new_models.extend(client_models)
+                    results = [self._fetch_instance_models(self.kamiwaza_client)]
+                else:
+                    results = self._fetch_models_from_clients(self.kamiwaza_clients)
+                # Instances that failed already fall back to their last good models; only
+                # treat it as an error when every instance failed and nothing was kept
+                for models, _ in results:
+                    new_models.extend(models)
+                if results and not any(fetched or models for models, fetched in results):
+                    had_error = True
             except Exception as e:
                 logger.error(f"Error fetching models from Kamiwaza: {e}")
                 had_error = True
@@ -373,23 +568,13 @@ class KamiwazaRouter(Router):
                  logger.warning(f"Found static model entry without 'model_name', skipping: {model}")
 
         # Apply model pattern filtering if set
-        if hasattr(self, 'model_pattern') and self.model_pattern:
-            pattern = self.model_pattern.lower()
-            pattern_filtered_models = []
-            for m in unique_models:
-                model_name = m.get('model_name', '')
-                if pattern in model_name.lower():
-                    logger.debug(f"Model {model_name} matches pattern {pattern}")
-                    pattern_filtered_models.append(m)
-                else:
-                    logger.debug(f"Model {model_name} does NOT match pattern {pattern}")
-            
-            logger.info(f"Filtered from {len(unique_models)} to {len(pattern_filtered_models)} models matching pattern '{pattern}'")
+        if getattr(self, '_pattern_re', None) is not None:
+            pattern_filtered_models = self._filter_by_pattern(unique_models)
+            logger.info(f"Filtered from {len(unique_models)} to {len(pattern_filtered_models)} models matching pattern '{self.model_pattern}'")
             unique_models = pattern_filtered_models
         
         # Update cache
-        self._cached_model_list = unique_models
-        self._cache_timestamp = current_time
+        self._set_model_cache(unique_models, current_time)
         logger.info(f"Updated model cache. Total unique models: {len(unique_models)} ({kamiwaza_source_count} from Kamiwaza, {static_source_count} static).")
 
         return unique_models
@@ -448,12 +633,13 @@ class KamiwazaRouter(Router):
 
     # Override set_model_list to clear cache if models are set externally
     def set_model_list(self, model_list: list):
-        """Sets the model list directly and clears the cache."""
+        """Sets the model list directly; it replaces the cached list (and name index) until the TTL expires."""
+        # Cache the new list first: Router.set_model_list() reads get_model_list(), which must
+        # not hand back the old cached list. Per-instance entries built from the old one go too.
+        self._set_model_cache(list(model_list), time.monotonic())
+        self._deployment_cache.clear()
         super().set_model_list(model_list=model_list)
-        # Clear cache when model list is set manually
-        self._cached_model_list = None
-        self._cache_timestamp = 0.0
-        logger.info("Model list set externally via set_model_list, cache cleared.")
+        logger.info("Model list set externally via set_model_list, cache replaced.")
         
     # Override completion method to ensure the model list is preserved
     def completion(self, model: str, messages: List[Dict[str, str]], **kwargs):
@@ -468,15 +654,32 @@ class KamiwazaRouter(Router):
         Returns:
             The completion response
         """
-        # Ensure the model exists in the model list
-        model_exists = False
-        for m in self.model_list:
-            if m.get("model_name") == model:
-                model_exists = True
-                break
-                
-        if not model_exists:
-            raise ValueError(f"Model '{model}' not found in model list. Available models: {[m.get('model_name') for m in self.model_list]}")
+        self._ensure_model_exists(model)
                 
         # Call parent completion method with current model list
         return super().completion(model=model, messages=messages, **kwargs)
+
+    # Override acompletion with the same model check so async callers fail fast too
+    async def acompletion(self, model: str, messages: List[Dict[str, str]], **kwargs):
+        """
+        Override of Router.acompletion to ensure model list is preserved.
+        
+        Args:
+            model: The model name to use for completion
+            messages: The messages to generate a completion for
+            **kwargs: All other parameters to pass to the model
+            
+        Returns:
+            The completion response
+        """
+        self._ensure_model_exists(model)
+        return await super().acompletion(model=model, messages=messages, **kwargs)
+
+    def _ensure_model_exists(self, model: str) -> None:
+        """Raises ValueError if model is not in the router's model list."""
+        if model in self._by_name:
+            return
+        # Not in the cached index; the router's own list may hold deployments added since
+        model_exists = any(m.get("model_name") == model for m in self.model_list)
+        if not model_exists:
+            raise ValueError(f"Model '{model}' not found in model list. Available models: {[m.get('model_name') for m in self.model_list]}")